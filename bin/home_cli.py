@@ -4,36 +4,35 @@
 Manages dotfiles with declarative symlinks and label-based filtering.
 """
 
-import argparse
 import os
-import subprocess
 import sys
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
-from home import (
-    Config,
-    execute_discard,
-    execute_install,
-    execute_link,
-    execute_pull,
-    execute_push,
-    execute_update,
-)
-from home.output import print_error, print_info
 
 
 # --------------------------------------------------------------------------- #
 # Configuration
 # --------------------------------------------------------------------------- #
 
-COMMANDS = {
-    "discard": execute_discard,
-    "install": execute_install,
-    "link":    execute_link,
-    "pull":    execute_pull,
-    "push":    execute_push,
-    "update":  execute_update,
-}
+COMMANDS = ('discard', 'install', 'link', 'pull', 'push', 'update')
+
+HELP_TEXT = """\
+usage: home [-h] [--dry-run] {discard,install,link,pull,push,update}
+
+Home configuration management tool
+
+commands:
+  install  - Link dotfiles, install mise tools, and reload fish shell
+  link     - Create symlinks from home.toml (filtered by labels in config.toml)
+  push     - Commit and push all changes with AI-generated commit message
+  pull     - Fetch and pull latest changes (requires clean working tree)
+  discard  - Discard all local changes and untracked files
+  update   - Pull, run mise install, and reload fish shell
+
+options:
+  -h, --help  show this help message and exit
+  --dry-run   print actions without executing them\
+"""
 
 
 # --------------------------------------------------------------------------- #
@@ -41,29 +40,47 @@ COMMANDS = {
 # --------------------------------------------------------------------------- #
 
 def main():
-    """Parse arguments and dispatch the requested command.
-
-    Commands:
-      install  - Link dotfiles, install mise tools, and reload fish shell
-      link     - Create symlinks from home.toml (filtered by labels in config.toml)
-      push     - Commit and push all changes with AI-generated commit message
-      pull     - Fetch and pull latest changes (requires clean working tree)
-      discard  - Discard all local changes and untracked files
-      update   - Pull, run mise install, and reload fish shell
+    """Parse arguments by hand and dispatch the requested command.
+
+    The argument surface is two flags and one positional, so a manual
+    scan over sys.argv replaces argparse and keeps startup import-free
+    until the command is validated.
     """
-    parser = argparse.ArgumentParser(description="Home configuration management tool")
-    parser.add_argument("command", choices=COMMANDS, help="command to execute")
-    parser.add_argument("--dry-run", action="store_true",
-                        help="print actions without executing them")
-    args = parser.parse_args()
+    arguments = sys.argv[1:]
+
+    # Answer help requests before importing any command module
+    if '-h' in arguments or '--help' in arguments:
+        print(HELP_TEXT)
+        return
+
+    # Separate the positionals from the flags
+    positionals = [arg for arg in arguments if not arg.startswith('-')]
+    flags = [arg for arg in arguments if arg.startswith('-')]
+
+    # Validate that exactly one known command and no stray flags remain
+    command = positionals[0] if len(positionals) == 1 else None
+    if command not in COMMANDS or any(flag != '--dry-run' for flag in flags):
+        print(HELP_TEXT, file=sys.stderr)
+        sys.exit(2)
+
+    # Import lazily so validation and help stay on the fast path
+    import importlib
+    import subprocess
+
+    from home.config import Config
+    from home.output import print_error, print_info
 
     # Initialize configuration
     config = Config()
-    config.dryrun = args.dry_run
+    config.dryrun = '--dry-run' in flags
+
+    # Resolve the handler from its command module
+    command_module = importlib.import_module(f'home.command_{command}')
+    handler = getattr(command_module, f'execute_{command}')
 
     # Dispatch command
     try:
-        COMMANDS[args.command](config)
+        handler(config)
     except subprocess.CalledProcessError as e:
         sys.exit(e.returncode)
     except KeyboardInterrupt:
@@ -1,34 +1,33 @@
 """Home configuration management library."""
 
-from .command_discard import execute_discard
-from .command_install import execute_install
-from .command_link import execute_link
-from .command_pull import execute_pull
-from .command_push import execute_push
-from .command_update import execute_update
-from .config import Config
-from .models import (
-    HomeEntry,
-    LabelRequirement,
-    SymlinkOperation,
-    SymlinkResult,
-    SymlinkStatus,
-)
+import importlib
 
-__all__ = [
+# Source module for each public name; imported lazily so a command only
+# pays for the modules it actually touches.
+_EXPORTS = {
     # Configuration
-    'Config',
+    'Config':            '.config',
     # Domain models
-    'HomeEntry',
-    'LabelRequirement',
-    'SymlinkOperation',
-    'SymlinkResult',
-    'SymlinkStatus',
+    'HomeEntry':         '.models',
+    'LabelRequirement':  '.models',
+    'SymlinkOperation':  '.models',
+    'SymlinkResult':     '.models',
+    'SymlinkStatus':     '.models',
     # Commands
-    'execute_install',
-    'execute_link',
-    'execute_push',
-    'execute_pull',
-    'execute_discard',
-    'execute_update',
-]
+    'execute_install':   '.command_install',
+    'execute_link':      '.command_link',
+    'execute_push':      '.command_push',
+    'execute_pull':      '.command_pull',
+    'execute_discard':   '.command_discard',
+    'execute_update':    '.command_update',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve a public name by importing its module on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -4,74 +4,58 @@
 # Imports
 # ============================================================
 
-import os
 import subprocess
 
+from . import gitclient
 from .config import Config
 from .output import print_header, print_info, print_success
 
 
+# ============================================================
+# Configuration
+# ============================================================
+
+# Batched discard steps: show pending changes, reset tracked files,
+# and remove untracked files in a single shell invocation.
+DISCARD_COMMAND = 'git status --short && git reset --hard && git clean -fd'
+
+
 # ============================================================
 # Entry Point
 # ============================================================
 
 def execute_discard(config: Config) -> None:
     """Discard all local changes and untracked files."""
-    # Navigate to repository root
-    os.chdir(config.repo_root)
-
     # Check for changes to discard
-    if not check_has_changes_to_discard():
+    if not check_has_changes_to_discard(config):
         print_info("No changes to discard")
         return
 
     print_header("Discarding changes")
 
-    # Show changes before discarding
-    show_git_status()
-
     # Discard changes
-    reset_tracked_files_to_head()
-    remove_untracked_files()
+    discard_all_changes(config)
 
 
 # ============================================================
 # Git Operations
 # ============================================================
 
-def check_has_changes_to_discard() -> bool:
+def check_has_changes_to_discard(config: Config) -> bool:
     """Check if repository has changes to discard."""
-    # Query git status
-    result = subprocess.run(
-        ['git', 'status', '--porcelain'],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Return true if output is not empty
-    return bool(result.stdout.strip())
+    return gitclient.has_uncommitted_changes(config.repo_root)
 
 
-def remove_untracked_files() -> None:
-    """Remove untracked files and directories."""
-    # Execute git clean
-    subprocess.run(['git', 'clean', '-fd'], check=True)
-
-    # Print success message
-    print_success("Untracked files removed")
-
+def discard_all_changes(config: Config) -> None:
+    """Show pending changes, then reset tracked and remove untracked files."""
+    # Print the command instead of executing it in dry-run mode
+    if config.dryrun:
+        print_info(f"Would run: {DISCARD_COMMAND}")
+        return
 
-def reset_tracked_files_to_head() -> None:
-    """Reset tracked files to HEAD."""
-    # Execute git reset
-    subprocess.run(['git', 'reset', '--hard'], check=True)
+    # Execute all discard steps in one shell invocation
+    subprocess.run(['sh', '-c', DISCARD_COMMAND], check=True, cwd=config.repo_root)
 
-    # Print success message
+    # Print success messages
     print_success("Tracked files reset")
-
-
-def show_git_status() -> None:
-    """Display current repository status in short format."""
-    # Execute git status with short format
-    subprocess.run(['git', 'status', '--short'], check=True)
+    print_success("Untracked files removed")
@@ -4,6 +4,7 @@
 # Imports
 # ============================================================
 
+import functools
 import os
 import shutil
 import subprocess
@@ -46,6 +47,12 @@ def execute_install_without_reload(config: Config) -> None:
 # Tools
 # ============================================================
 
+@functools.cache
+def find_executable(name: str) -> str | None:
+    """Locate an executable on PATH, caching the result for the process."""
+    return shutil.which(name)
+
+
 def install_mise_tools() -> None:
     """Trust and install mise-managed tools."""
     print_header("Installing tools")
@@ -60,7 +67,7 @@ def install_herdr_plugins(config: Config) -> None:
     """Install herdr plugins declared in config/herdr/plugins.toml."""
     plugins_file = config.repo_root / "config" / "herdr" / "plugins.toml"
 
-    if not plugins_file.exists() or shutil.which("herdr") is None:
+    if not plugins_file.exists() or find_executable("herdr") is None:
         return
 
     print_header("Installing herdr plugins")
@@ -4,9 +4,15 @@
 # Imports
 # ============================================================
 
-from .config import Config, load_config_labels, load_toml
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Callable
+
+from .config import Config, load_config_labels, load_toml_cached, pool_size
 from .models import HomeEntry, SymlinkOperation, SymlinkResult, SymlinkStatus
-from .output import Color, print_error, print_symlink_status
+from .output import Color, OutputBuffer, print_error
 
 
 # ============================================================
@@ -30,22 +36,23 @@ def execute_link(config: Config) -> list[SymlinkResult]:
     Returns:
         List of results from all operations
     """
-    # Validate configuration file
-    if not config.config_toml.exists():
+    # Parse labels, reporting a missing configuration file on read
+    try:
+        labels = load_config_labels(config)
+    except FileNotFoundError:
         print_error(f"config.toml not found at {config.config_toml}")
         raise SystemExit(1)
 
     # Parse symlink operations from configuration
-    labels = load_config_labels(config)
     all_operations = parse_symlink_operations(config)
 
-    # Filter operations by labels
-    matching_operations = [op for op in all_operations if op.entry.matches_labels(labels)]
-    discarded_operations = list(set(all_operations) - set(matching_operations))
+    # Partition operations by labels in a single pass
+    matching_operations, discarded_operations = partition_operations_by_labels(all_operations, labels)
 
-    # Execute operations and collect results
-    results = execute_matching_operations(config, matching_operations)
-    execute_discarded_operations(config, discarded_operations, results)
+    # Execute operations and emit all result lines in one write
+    with OutputBuffer():
+        results = execute_matching_operations(config, matching_operations)
+        execute_discarded_operations(config, discarded_operations, results)
 
     return results
 
@@ -54,36 +61,151 @@ def execute_link(config: Config) -> list[SymlinkResult]:
 # Operations
 # ============================================================
 
+def partition_operations_by_labels(
+    operations: list[SymlinkOperation],
+    labels: list[str],
+) -> tuple[list[SymlinkOperation], list[SymlinkOperation]]:
+    """
+    Split operations into matching and discarded lists in one pass.
+
+    The configured labels collapse into a frozenset once, so every
+    membership test during matching is a hash lookup instead of a scan
+    over the label list.
+    """
+    # Without configured labels only requirement-free entries can match,
+    # so skip the per-requirement checks entirely
+    if not labels:
+        matching = [op for op in operations if not op.entry.requirements]
+        discarded = [op for op in operations if op.entry.requirements]
+        return matching, discarded
+
+    label_set = frozenset(labels)
+
+    matching: list[SymlinkOperation] = []
+    discarded: list[SymlinkOperation] = []
+
+    # Route each operation by its label match, preserving input order
+    for operation in operations:
+        if operation.entry.matches_labels(label_set):
+            matching.append(operation)
+        else:
+            discarded.append(operation)
+
+    return matching, discarded
+
+
 def execute_matching_operations(config: Config, operations: list[SymlinkOperation]) -> list[SymlinkResult]:
     """Execute and print results for symlink operations matching current labels."""
-    results: list[SymlinkResult] = []
+    if not operations:
+        return []
+
+    # Operations whose target lies inside another operation's target can
+    # only link after the enclosing symlink exists, so they run last
+    claimed_targets = {operation.target_path for operation in operations}
+    independent_operations, nested_operations = partition_nested_operations(operations, claimed_targets)
+
+    # Enumerate each target directory once instead of stat'ing every target
+    listings = collect_target_directory_listings(independent_operations)
+    target_entries = [
+        listings[operation.target_path.parent].get(operation.target_path.name)
+        for operation in independent_operations
+    ]
+
+    # Create required parent directories once before applying operations
+    if not config.dryrun:
+        create_missing_parent_directories(independent_operations, target_entries)
+
+    # Apply operations concurrently; the filesystem syscalls release the GIL
+    with ThreadPoolExecutor(max_workers=pool_size(32, tasks_per_cpu=4)) as executor:
+        results = list(executor.map(partial(apply_install_operation, config), independent_operations, target_entries))
+
+    # Apply nested operations once their enclosing symlinks exist
+    results.extend(apply_nested_operations(config, nested_operations, claimed_targets))
+
+    # Print results afterwards to keep output order deterministic
+    for result in results:
+        print_symlink_result(result)
+
+    return results
+
+
+def partition_nested_operations(
+    operations: list[SymlinkOperation],
+    claimed_targets: set[Path],
+) -> tuple[list[SymlinkOperation], list[SymlinkOperation]]:
+    """
+    Split operations into independent ones and ones nested in a target.
+
+    An operation is nested when an ancestor of its target is itself the
+    target of another operation, for example a file entry pointing into
+    a directory entry's symlink. Such a target can only be linked after
+    the enclosing symlink exists.
+    """
+    independent: list[SymlinkOperation] = []
+    nested: list[SymlinkOperation] = []
 
-    # Process each operation
     for operation in operations:
-        result = apply_install_operation(config, operation)
-        results.append(result)
-        print_symlink_result(result)
+        if any(ancestor in claimed_targets for ancestor in operation.target_path.parents):
+            nested.append(operation)
+        else:
+            independent.append(operation)
+
+    return independent, nested
+
+
+def apply_nested_operations(
+    config: Config,
+    operations: list[SymlinkOperation],
+    claimed_targets: set[Path],
+) -> list[SymlinkResult]:
+    """
+    Apply operations whose targets sit inside other operations' targets.
+
+    These run serially in ascending target depth after the concurrent
+    batch, so every enclosing symlink is in place before a nested target
+    links through it.
+    """
+    results: list[SymlinkResult] = []
+
+    for operation in sorted(operations, key=lambda op: len(op.target_path.parts)):
+        # Rescan the parent now that the enclosing symlinks exist
+        listing = collect_target_directory_listings([operation])
+        target_entry = listing[operation.target_path.parent].get(operation.target_path.name)
+
+        # Create intermediate directories, but never at a path another
+        # operation claims as its own symlink target
+        parent = operation.target_path.parent
+        if not config.dryrun and target_entry is None and parent not in claimed_targets:
+            os.makedirs(parent, exist_ok=True)
+
+        results.append(apply_install_operation(config, operation, target_entry))
 
     return results
 
 
 def execute_discarded_operations(config: Config, operations: list[SymlinkOperation], results: list[SymlinkResult]) -> None:
     """Execute and print results for discarded symlink operations."""
-    # Process each discarded operation
-    for operation in operations:
+    # Only targets that are currently symlinks are removal candidates;
+    # one islink check here filters missing and regular-file targets
+    removable_operations = [
+        operation for operation in operations
+        if os.path.islink(operation.target_path)
+    ]
+
+    # Process each removable operation
+    for operation in removable_operations:
         result = apply_removal_operation(config, operation)
 
         # Add result if symlink was removed
         if result:
             results.append(result)
-            if result.status in (SymlinkStatus.REMOVED, SymlinkStatus.REMOVED_DRYRUN):
-                print_symlink_status(result.table_name, result.status.value, Color.YELLOW, str(result.target_path))
+            print_symlink_result(result)
 
 
 def parse_symlink_operations(config: Config) -> list[SymlinkOperation]:
     """Parse all symlink operations from home.toml without filtering."""
     # Load home.toml configuration
-    home_config = load_toml(config.home_toml)
+    home_config = load_toml_cached(config.home_toml)
     operations: list[SymlinkOperation] = []
 
     # Build operations from each table
@@ -91,23 +213,39 @@ def parse_symlink_operations(config: Config) -> list[SymlinkOperation]:
         # Normalize single dict entries into a list
         entry_dicts = [table_data] if isinstance(table_data, dict) else table_data if isinstance(table_data, list) else []
 
-        for entry_dict in entry_dicts:
-            entry = HomeEntry.from_toml(table_name, entry_dict)
-            operations.append(SymlinkOperation(
-                entry=entry,
-                source_path=entry.resolve_source_path(config.repo_root),
-                target_path=entry.resolve_target_path(),
-            ))
+        # Construct all operations of the table in one extend call
+        operations.extend(
+            build_symlink_operation(config, table_name, entry_dict)
+            for entry_dict in entry_dicts
+        )
 
     return operations
 
 
+def build_symlink_operation(config: Config, table_name: str, entry_dict: dict) -> SymlinkOperation:
+    """Build a symlink operation from a single home.toml entry."""
+    entry = HomeEntry.from_toml(table_name, entry_dict)
+    return SymlinkOperation(
+        entry=entry,
+        source_path=entry.resolve_source_path(config.repo_root),
+        target_path=entry.resolve_target_path(),
+    )
+
+
 # ============================================================
 # Symlinks
 # ============================================================
 
-def apply_install_operation(config: Config, operation: SymlinkOperation) -> SymlinkResult:
-    """Apply a symlink installation operation."""
+def apply_install_operation(
+    config: Config,
+    operation: SymlinkOperation,
+    target_entry: os.DirEntry | None,
+) -> SymlinkResult:
+    """Apply a symlink installation operation.
+
+    The target's directory entry comes from the per-directory scandir
+    pass, so classifying the target needs no additional stat syscall.
+    """
     # Validate source file exists
     if not operation.source_path.exists():
         return SymlinkResult(
@@ -115,31 +253,30 @@ def apply_install_operation(config: Config, operation: SymlinkOperation) -> Syml
             status=SymlinkStatus.SKIPPED_SOURCE_NOT_FOUND,
         )
 
+    # Create new symlink when the target is missing
+    if target_entry is None:
+        return create_symlink(config, operation)
+
     # Evaluate existing symlink
-    if operation.target_path.is_symlink():
+    if target_entry.is_symlink():
         return evaluate_existing_symlink(config, operation)
 
     # Handle existing non-symlink file
-    if operation.target_path.exists():
-        return SymlinkResult(
-            operation=operation,
-            status=SymlinkStatus.SKIPPED_NOT_SYMLINK,
-        )
-
-    # Create new symlink
-    return create_symlink(config, operation)
+    return SymlinkResult(
+        operation=operation,
+        status=SymlinkStatus.SKIPPED_NOT_SYMLINK,
+    )
 
 
 def apply_removal_operation(config: Config, operation: SymlinkOperation) -> SymlinkResult | None:
-    """Apply a symlink removal operation for discarded entries."""
-    # Verify target is a symlink
-    if not operation.target_path.is_symlink():
-        return None
+    """Apply a symlink removal operation for discarded entries.
 
+    The caller has already verified that the target is a symlink, so
+    this function goes straight to the link destination check.
+    """
     try:
         # Verify symlink points to our source
-        resolved_target = operation.target_path.resolve()
-        if resolved_target != operation.source_path.resolve():
+        if not symlink_points_to_source(operation):
             return None
 
         # Remove symlink based on mode
@@ -155,16 +292,100 @@ def apply_removal_operation(config: Config, operation: SymlinkOperation) -> Syml
         return None
 
 
+def collect_target_directory_listings(operations: list[SymlinkOperation]) -> dict[Path, dict[str, os.DirEntry]]:
+    """
+    Scan each unique target directory once and index its entries by name.
+
+    One scandir per directory replaces an lstat per target, since the
+    directory entries already carry the symlink flag. Missing directories
+    yield an empty listing.
+    """
+    listings: dict[Path, dict[str, os.DirEntry]] = {}
+
+    # Enumerate each unique parent directory once
+    for parent in {operation.target_path.parent for operation in operations}:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {entry.name: entry for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            listings[parent] = {}
+
+    return listings
+
+
+def create_missing_parent_directories(
+    operations: list[SymlinkOperation],
+    target_entries: list[os.DirEntry | None],
+) -> None:
+    """
+    Create each unique missing parent directory before linking.
+
+    Deduplicating the directories here lets create_symlink skip its own
+    mkdir walk for every sibling link sharing a parent. Only operations
+    that will actually create a link get their parent created.
+    """
+    # Collect unique parents of links that will be created
+    parents = {
+        operation.target_path.parent
+        for operation, target_entry in zip(operations, target_entries)
+        if target_entry is None and operation.source_path.exists()
+    }
+
+    # Create shallow directories first so nested parents reuse them
+    for parent in sorted(parents, key=lambda path: len(path.parts)):
+        os.makedirs(parent, exist_ok=True)
+
+
+def symlink_points_to_source(operation: SymlinkOperation) -> bool:
+    """
+    Check whether the target symlink points to the operation's source.
+
+    Compares the raw link destination lexically to avoid resolving every
+    path component; falls back to a full resolve only when the link
+    destination contains '..' components.
+    """
+    # Read the raw link destination
+    link_destination = Path(os.readlink(operation.target_path))
+
+    # Anchor relative destinations at the symlink's directory
+    if not link_destination.is_absolute():
+        link_destination = operation.target_path.parent / link_destination
+
+    # Compare lexically first
+    if os.path.normpath(link_destination) == os.path.normpath(operation.source_path):
+        return True
+
+    # Resolve fully only when the lexical compare is inconclusive
+    if '..' in link_destination.parts:
+        return operation.target_path.resolve() == resolve_source_path(operation.source_path)
+
+    return False
+
+
+@lru_cache(maxsize=None)
+def resolve_source_path(source_path: Path) -> Path:
+    """Resolve a source path once per process.
+
+    Sources live under the repository root and share path prefixes, so
+    repeated resolve() walks over the same components are redundant.
+    """
+    return source_path.resolve()
+
+
 def create_symlink(config: Config, operation: SymlinkOperation) -> SymlinkResult:
     """Create a new symlink."""
     # Select status based on mode
     if config.dryrun:
         status = SymlinkStatus.CREATED_DRYRUN
     else:
-        # Create parent directories and symlink
-        operation.target_path.parent.mkdir(parents=True, exist_ok=True)
-        operation.target_path.symlink_to(operation.source_path)
-        status = SymlinkStatus.CREATED
+        try:
+            # Create the symlink; the parent directory already exists
+            operation.target_path.symlink_to(operation.source_path)
+            status = SymlinkStatus.CREATED
+        except FileExistsError:
+            # Something else claimed the target since the directory
+            # scan, for example a conflicting entry in the same batch
+            status = SymlinkStatus.SKIPPED_NOT_SYMLINK
 
     return SymlinkResult(operation=operation, status=status)
 
@@ -176,7 +397,7 @@ def evaluate_existing_symlink(config: Config, operation: SymlinkOperation) -> Sy
         existing_target = operation.target_path.resolve()
 
         # Check if symlink already points to correct source
-        if existing_target == operation.source_path.resolve():
+        if existing_target == resolve_source_path(operation.source_path):
             return SymlinkResult(
                 operation=operation,
                 status=SymlinkStatus.ALREADY_EXISTS,
@@ -219,12 +440,49 @@ def override_symlink(config: Config, operation: SymlinkOperation) -> SymlinkResu
 
 def print_symlink_result(result: SymlinkResult) -> None:
     """Print formatted result for a symlink operation."""
-    # Select output format based on status
-    if result.status == SymlinkStatus.SKIPPED_SOURCE_NOT_FOUND:
-        print_error(f"[{result.table_name}] Source not found -> {result.operation.source_path}")
-    elif result.status == SymlinkStatus.ALREADY_EXISTS:
-        print_symlink_status(result.table_name, result.status.value, Color.GRAY, str(result.target_path), monochrome=True)
-    elif result.status == SymlinkStatus.SKIPPED_NOT_SYMLINK:
-        print_symlink_status(result.table_name, result.status.value, Color.YELLOW, str(result.target_path))
-    elif result.status in (SymlinkStatus.CREATED, SymlinkStatus.CREATED_DRYRUN, SymlinkStatus.OVERRIDDEN, SymlinkStatus.OVERRIDDEN_DRYRUN):
-        print_symlink_status(result.table_name, result.status.value, Color.GREEN, str(result.target_path))
+    # Dispatch to the printer registered for this status
+    printer = _STATUS_PRINTERS.get(result.status)
+    if printer:
+        printer(result)
+
+
+def make_status_printer(status: SymlinkStatus, color: str) -> Callable[[SymlinkResult], None]:
+    """Build a printer with the line template precomputed for a status.
+
+    Colors and status text become constants of the template, so each
+    printed result only fills in the table name and target path.
+    """
+    template = f"[{Color.CYAN}{{table}}{Color.RESET}] {color}{status.value}{Color.RESET} -> {{target}}"
+
+    def print_result(result: SymlinkResult) -> None:
+        print(template.format(table=result.table_name, target=result.target_path))
+
+    return print_result
+
+
+def print_source_not_found(result: SymlinkResult) -> None:
+    """Print an error for a missing symlink source."""
+    print_error(f"[{result.table_name}] Source not found -> {result.operation.source_path}")
+
+
+# Template for the muted "already exists" line, colored as a whole
+_EXISTS_TEMPLATE = f"{Color.GRAY}[{{table}}] {SymlinkStatus.ALREADY_EXISTS.value} -> {{target}}{Color.RESET}"
+
+
+def print_already_exists(result: SymlinkResult) -> None:
+    """Print a muted line for a symlink that is already in place."""
+    print(_EXISTS_TEMPLATE.format(table=result.table_name, target=result.target_path))
+
+
+# Printer per status, resolved once at import time instead of per result
+_STATUS_PRINTERS: dict[SymlinkStatus, Callable[[SymlinkResult], None]] = {
+    SymlinkStatus.SKIPPED_SOURCE_NOT_FOUND: print_source_not_found,
+    SymlinkStatus.ALREADY_EXISTS: print_already_exists,
+    SymlinkStatus.SKIPPED_NOT_SYMLINK: make_status_printer(SymlinkStatus.SKIPPED_NOT_SYMLINK, Color.YELLOW),
+    SymlinkStatus.CREATED: make_status_printer(SymlinkStatus.CREATED, Color.GREEN),
+    SymlinkStatus.CREATED_DRYRUN: make_status_printer(SymlinkStatus.CREATED_DRYRUN, Color.GREEN),
+    SymlinkStatus.OVERRIDDEN: make_status_printer(SymlinkStatus.OVERRIDDEN, Color.GREEN),
+    SymlinkStatus.OVERRIDDEN_DRYRUN: make_status_printer(SymlinkStatus.OVERRIDDEN_DRYRUN, Color.GREEN),
+    SymlinkStatus.REMOVED: make_status_printer(SymlinkStatus.REMOVED, Color.YELLOW),
+    SymlinkStatus.REMOVED_DRYRUN: make_status_printer(SymlinkStatus.REMOVED_DRYRUN, Color.YELLOW),
+}
@@ -4,10 +4,11 @@
 # Imports
 # ============================================================
 
-import os
+import functools
 import shutil
 import subprocess
 
+from . import gitclient
 from .config import Config
 from .output import (
     print_error,
@@ -24,125 +25,94 @@ from .output import (
 
 def execute_push(config: Config) -> None:
     """Stage, commit, and push all changes."""
-    # Navigate to repository root
-    os.chdir(config.repo_root)
+    # Stage all changes and read the staged diff in one invocation
+    staged_diff = gitclient.add_all_and_diff_cached(config.repo_root)
 
-    # Check for uncommitted changes
-    if not check_has_uncommitted_changes():
+    # Check for staged changes
+    if not staged_diff.strip():
         print_info("No changes to commit")
         return
 
     print_header("Pushing changes")
-
-    # Stage all changes
-    stage_all_changes()
+    print_success("Staged all changes")
 
     # Generate and display commit message
-    commit_message = generate_commit_message()
+    commit_message = generate_commit_message(staged_diff)
     print_key_value("Commit message", commit_message)
 
     # Create commit and push to remote
-    create_commit(commit_message)
-    push_commits_to_remote()
+    create_commit(config, commit_message)
+    push_commits_to_remote(config)
 
 
 # ============================================================
 # Git Operations
 # ============================================================
 
-def check_has_uncommitted_changes() -> bool:
-    """Check if repository has uncommitted changes."""
-    # Query git status
-    result = subprocess.run(
-        ['git', 'status', '--porcelain'],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Return true if output is not empty
-    return bool(result.stdout.strip())
-
-
-def create_commit(message: str) -> None:
+def create_commit(config: Config, message: str) -> None:
     """Create a commit with the given message."""
-    # Execute git commit
-    subprocess.run(['git', 'commit', '-m', message], check=True)
-
-    # Print success message
+    gitclient.commit(message, config.repo_root)
     print_success("Changes committed")
 
 
-def get_staged_diff() -> str:
-    """Get diff of staged changes."""
-    # Query git diff for staged changes
-    result = subprocess.run(
-        ['git', 'diff', '--cached'],
-        capture_output=True,
-        text=True,
-        check=True
-    )
-
-    # Return diff output
-    return result.stdout
-
-
-def push_commits_to_remote() -> None:
+def push_commits_to_remote(config: Config) -> None:
     """Push commits to remote repository."""
-    # Execute git push
-    subprocess.run(['git', 'push'], check=True)
-
-    # Print success message
+    gitclient.push(config.repo_root)
     print_success("Changes pushed to remote")
 
 
-def stage_all_changes() -> None:
-    """Stage all changes in the repository."""
-    # Execute git add
-    subprocess.run(['git', 'add', '-A'], check=True)
-
-    # Print success message
-    print_success("Staged all changes")
-
-
 # ============================================================
 # Commit Message Generation
 # ============================================================
 
-def generate_commit_message() -> str:
+@functools.cache
+def find_claude_executable() -> str | None:
+    """Locate the Claude CLI on PATH, caching the result for the process."""
+    return shutil.which('claude')
+
+
+def generate_commit_message(staged_diff: str) -> str:
     """Generate commit message using Claude if available, otherwise use default."""
     # Check if Claude CLI is available
-    if not shutil.which('claude'):
+    if not find_claude_executable():
         return "Update configuration"
 
     # Attempt to generate message with Claude
     print_info("Generating commit message with Claude...")
 
+    prompt_header = (
+        "Based on the following git diff, generate a concise commit message\n"
+        "(50 characters or less) that describes the changes. Return only the\n"
+        "commit message, nothing else, without any quotation marks.\n\n"
+    )
+
+    # Start Claude and stream the prompt into its stdin, avoiding a
+    # second in-memory copy of the diff from string concatenation
+    process = subprocess.Popen(
+        ['claude', '-p'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
     try:
-        # Get staged diff and construct prompt
-        staged_diff = get_staged_diff()
-        claude_prompt = (
-            "Based on the following git diff, generate a concise commit message\n"
-            "(50 characters or less) that describes the changes. Return only the\n"
-            "commit message, nothing else, without any quotation marks.\n\n"
-            f"{staged_diff}"
-        )
-
-        # Call Claude CLI
-        result = subprocess.run(
-            ['claude', '-p'],
-            input=claude_prompt,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        # Extract and return commit message
-        commit_message = result.stdout.strip().split('\n')[0]
-        return commit_message if commit_message else "Update configuration"
-
-    except subprocess.CalledProcessError as e:
-        # Handle Claude CLI error
-        if e.stderr:
-            print_error(f"Claude error: {e.stderr}")
+        # Write the header first so only the diff goes through
+        # communicate, avoiding a concatenated second copy of it
+        process.stdin.write(prompt_header)
+    except BrokenPipeError:
+        pass
+
+    # Feed the diff while draining stdout and stderr concurrently;
+    # sequential reads could deadlock on full pipe buffers
+    stdout, stderr = process.communicate(staged_diff)
+
+    # Handle Claude CLI error
+    if process.returncode != 0:
+        if stderr:
+            print_error(f"Claude error: {stderr}")
         return "Update configuration"
+
+    # Extract and return commit message
+    commit_message = stdout.strip().split('\n')[0]
+    return commit_message if commit_message else "Update configuration"
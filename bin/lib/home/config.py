@@ -4,6 +4,8 @@
 # Imports
 # ============================================================
 
+import os
+import pickle
 import subprocess
 import sys
 from pathlib import Path
@@ -25,17 +27,7 @@ class Config:
     """Configuration paths and global state."""
 
     def __init__(self):
-        # Resolve repository root directory via git
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                capture_output=True, text=True, check=True,
-                cwd=Path(__file__).parent,
-            )
-            self.repo_root = Path(result.stdout.strip())
-        except subprocess.CalledProcessError:
-            print("Error: Not inside a git repository", file=sys.stderr)
-            sys.exit(1)
+        self.repo_root = resolve_repo_root()
 
         # Configuration file paths
         self.home_toml = self.repo_root / "home.toml"
@@ -45,24 +37,137 @@ class Config:
         self.dryrun = False
 
 
+def resolve_repo_root() -> Path:
+    """
+    Resolve the repository root without forking git when possible.
+
+    An explicit HOME_REPO_ROOT override wins, then the root is derived
+    from this file's location when a .git marker confirms it. Only when
+    both fail does the resolution fall back to `git rev-parse`.
+    """
+    # Honor an explicit override from the environment
+    root_env = os.environ.get("HOME_REPO_ROOT")
+    if root_env:
+        return Path(root_env)
+
+    # This file lives at bin/lib/home/config.py, so the repository root
+    # is three levels up; verify with the .git marker before trusting it
+    candidate = Path(__file__).resolve().parents[3]
+    if (candidate / ".git").exists():
+        return candidate
+
+    # Fall back to asking git, for example when the scripts are
+    # installed outside a checkout
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).parent,
+        )
+        return Path(result.stdout.strip())
+    except subprocess.CalledProcessError:
+        print("Error: Not inside a git repository", file=sys.stderr)
+        sys.exit(1)
+
+
+# ============================================================
+# Concurrency
+# ============================================================
+
+def pool_size(cap: int, tasks_per_cpu: int = 1) -> int:
+    """
+    Size a thread pool from the CPUs actually available to this process.
+
+    os.sched_getaffinity reflects cgroup and taskset limits where it
+    exists; platforms without it fall back to os.cpu_count. I/O-bound
+    pools can pass tasks_per_cpu to oversubscribe deliberately, and cap
+    bounds the result either way.
+    """
+    try:
+        cpu_count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpu_count = os.cpu_count() or 4
+    return min(cap, cpu_count * tasks_per_cpu)
+
+
 # ============================================================
 # TOML Loading
 # ============================================================
 
+# In-process cache of parsed TOML files, keyed by path and file metadata
+_toml_cache: dict[tuple[str, int, int], dict[str, Any]] = {}
+
+
 def load_toml(path: Path) -> dict[str, Any]:
-    """Load and parse a TOML file."""
-    with open(path, 'rb') as f:
-        return tomllib.load(f)
+    """
+    Load and parse a TOML file, memoizing the parse per process.
 
+    The cache key includes mtime and size, so an edited file reparses.
+    Callers treat the returned dict as read-only.
+    """
+    # Look up a previous parse of the same file state
+    source_stat = os.stat(path)
+    cache_key = (str(path), source_stat.st_mtime_ns, source_stat.st_size)
+    cached_data = _toml_cache.get(cache_key)
+    if cached_data is not None:
+        return cached_data
 
-def load_config_labels(config: Config) -> list[str]:
+    # Read the whole file once so the parser walks an in-memory buffer
+    # instead of issuing many small stream reads
+    data = tomllib.loads(path.read_bytes().decode('utf-8'))
+    _toml_cache[cache_key] = data
+    return data
+
+
+def load_toml_cached(path: Path) -> dict[str, Any]:
     """
-    Extract labels from config.toml.
+    Load a TOML file through a pickled sidecar cache.
 
-    Returns empty list when file is missing or unreadable.
+    The cache lives under the XDG cache directory and is keyed by the
+    source file's mtime and size, so edits invalidate it automatically.
+    Falls back to a plain parse on any cache error.
     """
+    # Build the cache key from the source file's metadata
+    source_stat = os.stat(path)
+    cache_key = (source_stat.st_mtime_ns, source_stat.st_size)
+    cache_path = resolve_cache_path(path)
+
+    # Return the cached parse when the key matches
     try:
-        config_data = load_toml(config.config_toml)
-        return config_data.get('labels', [])
+        with open(cache_path, 'rb') as f:
+            cached_key, cached_data = pickle.load(f)
+        if cached_key == cache_key:
+            return cached_data
     except Exception:
-        return []
+        pass
+
+    # Parse the file and refresh the cache atomically, so a concurrent
+    # reader never sees a partially written pickle
+    data = load_toml(path)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(f'.tmp{os.getpid()}')
+        with open(temp_path, 'wb') as f:
+            pickle.dump((cache_key, data), f)
+        os.replace(temp_path, cache_path)
+    except Exception:
+        pass
+
+    return data
+
+
+def resolve_cache_path(path: Path) -> Path:
+    """Return the sidecar cache location for a configuration file."""
+    cache_home = Path(os.environ.get('XDG_CACHE_HOME', '~/.cache')).expanduser()
+    return cache_home / 'home' / f'{path.name}.pickle'
+
+
+def load_config_labels(config: Config) -> list[str]:
+    """
+    Extract labels from config.toml.
+
+    Raises FileNotFoundError when the file is missing, so callers can
+    report the path without probing for it beforehand.
+    """
+    config_data = load_toml(config.config_toml)
+    return config_data.get('labels', [])
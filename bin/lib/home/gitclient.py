@@ -0,0 +1,82 @@
+"""Shared git invocation helpers."""
+
+# ============================================================
+# Imports
+# ============================================================
+
+import subprocess
+from pathlib import Path
+
+
+# ============================================================
+# Queries
+# ============================================================
+
+def status_porcelain(repo_root: Path) -> str:
+    """Return the repository status in porcelain format."""
+    return run_query(['git', 'status', '--porcelain'], repo_root)
+
+
+def diff_cached(repo_root: Path) -> str:
+    """Return the diff of staged changes."""
+    return run_query(['git', 'diff', '--cached'], repo_root)
+
+
+def has_uncommitted_changes(repo_root: Path) -> bool:
+    """Check if the repository has uncommitted changes."""
+    return bool(status_porcelain(repo_root).strip())
+
+
+def add_all_and_diff_cached(repo_root: Path) -> str:
+    """Stage all changes and return the staged diff in one shell invocation."""
+    return run_query(['sh', '-c', 'git add -A && git diff --cached'], repo_root)
+
+
+# ============================================================
+# Mutations
+# ============================================================
+
+def add_all(repo_root: Path) -> None:
+    """Stage all changes in the repository."""
+    run(['git', 'add', '-A'], repo_root)
+
+
+def commit(message: str, repo_root: Path) -> None:
+    """Create a commit with the given message."""
+    run(['git', 'commit', '-m', message], repo_root)
+
+
+def push(repo_root: Path) -> None:
+    """Push commits to the remote repository."""
+    run(['git', 'push'], repo_root)
+
+
+def pull_and_update_submodules(repo_root: Path) -> None:
+    """Pull latest commits and update submodules in one shell invocation."""
+    run(['sh', '-c', 'git pull --ff-only && git submodule update --init --recursive'], repo_root)
+
+
+# ============================================================
+# Supporting Code
+# ============================================================
+
+def run(args: list[str], repo_root: Path) -> None:
+    """Run a git command in the repository, passing its output through."""
+    subprocess.run(args, check=True, cwd=repo_root)
+
+
+def run_query(args: list[str], repo_root: Path) -> str:
+    """Run a git command in the repository and return its captured stdout.
+
+    Only stdout is captured; stderr passes through to the terminal so a
+    failing command still surfaces git's error message before the CLI
+    exits with the command's return code.
+    """
+    result = subprocess.run(
+        args,
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+        cwd=repo_root
+    )
+    return result.stdout
@@ -4,7 +4,8 @@
 # Imports
 # ============================================================
 
-from dataclasses import dataclass
+from collections.abc import Callable, Set as AbstractSet
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -32,7 +33,7 @@ class SymlinkStatus(Enum):
 # Label Models
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LabelRequirement:
     """
     A label requirement for filtering configuration entries.
@@ -44,6 +45,20 @@ class LabelRequirement:
 
     labels: tuple[str, ...]
 
+    # Matcher closure specialized for this requirement at construction
+    _match: Callable[[AbstractSet[str]], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Specialize the matcher: a single label becomes a membership
+        # test, an OR requirement becomes a set intersection check
+        if len(self.labels) == 1:
+            match = lambda config_labels, label=self.labels[0]: label in config_labels
+        else:
+            match = lambda config_labels, label_set=frozenset(self.labels): not label_set.isdisjoint(config_labels)
+
+        # Assign through object.__setattr__ because the dataclass is frozen
+        object.__setattr__(self, '_match', match)
+
     @classmethod
     def from_value(cls, value: str | list[str]) -> 'LabelRequirement':
         """
@@ -62,22 +77,18 @@ class LabelRequirement:
         else:
             raise ValueError(f"Invalid label requirement: {value}")
 
-    def matches(self, config_labels: list[str]) -> bool:
+    def matches(self, config_labels: AbstractSet[str]) -> bool:
         """
         Check if this requirement is satisfied by the provided labels.
 
         Args:
-            config_labels: Labels from config.toml
+            config_labels: Set of labels from config.toml
 
         Returns:
             True if requirement is satisfied
         """
-        # Single label requirement
-        if len(self.labels) == 1:
-            return self.labels[0] in config_labels
-
-        # OR requirement: at least one label must match
-        return any(label in config_labels for label in self.labels)
+        # Delegate to the matcher specialized at construction time
+        return self._match(config_labels)
 
     def __repr__(self) -> str:
         if len(self.labels) == 1:
@@ -90,7 +101,7 @@ class LabelRequirement:
 # Home Entry Models
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HomeEntry:
     """
     A configuration entry from home.toml.
@@ -136,14 +147,14 @@ class HomeEntry:
             requirements=tuple(requirements)
         )
 
-    def matches_labels(self, config_labels: list[str]) -> bool:
+    def matches_labels(self, config_labels: AbstractSet[str]) -> bool:
         """
         Check if this entry's requirements are satisfied by config labels.
 
         Uses AND logic: all requirements must be satisfied.
 
         Args:
-            config_labels: Labels from config.toml
+            config_labels: Set of labels from config.toml
 
         Returns:
             True if all requirements are satisfied (or no requirements)
@@ -181,7 +192,7 @@ class HomeEntry:
 # Symlink Operation Models
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymlinkOperation:
     """
     A planned symlink operation with resolved paths.
@@ -198,6 +209,17 @@ class SymlinkOperation:
     source_path: Path
     target_path: Path
 
+    # String form of the target path and its hash, computed once at
+    # construction so equality and hashing stay C-level string operations
+    _target_str: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Assign through object.__setattr__ because the dataclass is frozen
+        target_str = str(self.target_path)
+        object.__setattr__(self, '_target_str', target_str)
+        object.__setattr__(self, '_hash', hash(target_str))
+
     @property
     def table_name(self) -> str:
         """Get the table name from the entry."""
@@ -207,14 +229,14 @@ class SymlinkOperation:
         """Operations are equal if they have the same target path."""
         if not isinstance(other, SymlinkOperation):
             return NotImplemented
-        return self.target_path == other.target_path
+        return self._target_str == other._target_str
 
     def __hash__(self) -> int:
-        """Hash based on target path for set operations."""
-        return hash(self.target_path)
+        """Return the precomputed target path hash."""
+        return self._hash
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymlinkResult:
     """
     Result of executing a symlink operation.
@@ -4,6 +4,7 @@
 # Imports
 # ============================================================
 
+import io
 import sys
 
 
@@ -23,6 +24,32 @@ class Color:
     GRAY = '\033[90m'
 
 
+# ============================================================
+# Buffering
+# ============================================================
+
+class OutputBuffer:
+    """
+    Context manager that collects stdout writes and flushes them once.
+
+    Collapses the per-line write syscalls of large result listings into
+    a single write on exit. Error output stays on stderr and is not
+    buffered.
+    """
+
+    def __enter__(self) -> 'OutputBuffer':
+        # Swap stdout for an in-memory buffer
+        self._original_stdout = sys.stdout
+        sys.stdout = io.StringIO()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Restore stdout and emit the buffered output in one write
+        buffered = sys.stdout
+        sys.stdout = self._original_stdout
+        sys.stdout.write(buffered.getvalue())
+
+
 # ============================================================
 # Output Functions
 # ============================================================